@@ -1,19 +1,215 @@
 # db_manager.py
-import os, sqlite3, json, time, shutil
+import os, sqlite3, json, time, shutil, threading, queue, functools, weakref
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from urllib.request import pathname2url
 from typing import Optional
 
+try:
+    import msgpack # Binary encoding for stored configs (faster to decode than JSON)
+except ImportError:
+    msgpack = None
+
 PROJECT_ROOT = os.path.abspath(os.getcwd()) # Project's root directory (absolute path)
 
+# SQL statements used by the getters and setters, defined once at module level
+_SQL_GET_ID_BY_DIR = "SELECT id FROM models WHERE dir_path = ?"
+_SQL_GET_BASIC = "SELECT name, dir_path FROM models WHERE id = ?"
+_SQL_GET_ALL = "SELECT id, name FROM models ORDER BY created_at DESC"
+_SQL_SAVE_TRAIN_CFG = (
+    "INSERT INTO training_configs(model_id, config_blob) "
+    "VALUES(?,?) "
+    "ON CONFLICT(model_id) DO UPDATE SET config_blob=excluded.config_blob"
+)
+_SQL_SAVE_TRAIN_LOG = (
+    "INSERT INTO training_logs(model_id, log_path) "
+    "VALUES(?,?) "
+    "ON CONFLICT(model_id) DO UPDATE SET log_path=excluded.log_path"
+)
+_SQL_SAVE_INFER_CFG = (
+    "INSERT INTO inference_configs(model_id, config_blob) "
+    "VALUES(?,?) "
+    "ON CONFLICT(model_id) DO UPDATE SET config_blob=excluded.config_blob"
+)
+_SQL_SAVE_INFER_HIST = (
+    "INSERT INTO inference_history(model_id, content) "
+    "VALUES(?,?) "
+    "ON CONFLICT(model_id) DO UPDATE SET content=excluded.content"
+)
+_SQL_CLEAR_INFER_HIST = "DELETE FROM inference_history WHERE model_id = ?"
+_SQL_GET_TRAIN_CFG = "SELECT config_blob FROM training_configs WHERE model_id = ?"
+_SQL_GET_TRAIN_LOG = "SELECT log_path FROM training_logs WHERE model_id = ?"
+_SQL_GET_INFER_CFG = "SELECT config_blob FROM inference_configs WHERE model_id = ?"
+_SQL_GET_INFER_HIST = "SELECT content FROM inference_history WHERE model_id = ?"
+
+# Schema version stored in PRAGMA user_version. Version 1 stores the per-model
+# child tables WITHOUT ROWID; version 2 stores configs in a BLOB column.
+# Databases older than the current version have these tables rebuilt on open.
+_SCHEMA_VERSION = 2
+_WITHOUT_ROWID_TABLES = ("training_configs", "training_logs", "inference_configs")
+
+# LRU of get_model_basic_info results, shared per database file so that every
+# DBManager instance in the process sees invalidations made by the others
+_INFO_CACHE_SIZE = 256
+_info_caches: dict[str, OrderedDict] = {}
+# Negative cache of model IDs known not to exist (insertion-ordered, oldest dropped first)
+_MISSING_CACHE_SIZE = 1024
+_missing_caches: dict[str, dict] = {}
+# Bumped on every invalidation; a lookup only caches its result (hit or miss) if the
+# generation is unchanged, so a read that races a register/rename/delete is never cached
+_info_generations: dict[str, int] = {}
+_info_cache_lock = threading.Lock()
+
+# The writer thread commits queued statements in batches of up to this many
+# items, or whatever arrives within this many seconds of the first one
+_WRITE_BATCH_SIZE = 100
+_WRITE_BATCH_WINDOW = 0.005
+
+# One _RegistryWriter per database file, shared (and reference-counted) by every
+# DBManager in the process
+_writers: dict[str, "_RegistryWriter"] = {}
+_writers_lock = threading.Lock()
+
+@functools.lru_cache(maxsize=1024)
+def _rel_cached(path: str, root: str) -> str:
+    """Relativizes an absolute path against `root` (memoized; paths repeat across calls)."""
+    path = os.path.normpath(path)
+    # Fast path: strip the root prefix directly
+    prefix = root + os.sep
+    if path.startswith(prefix):
+        return path[len(prefix):]
+    # Try to get a relative path from the project root
+    try:
+        return os.path.relpath(path, root)
+    except ValueError:
+        # If on different drives (Windows), return the original path
+        return path
+
+@functools.lru_cache(maxsize=1024)
+def _abs_cached(rel_path: str, root: str) -> str:
+    """Resolves a relative path against `root` with join+normpath (memoized)."""
+    return os.path.normpath(os.path.join(root, rel_path))
+
+class _RegistryWriter:
+    """
+    Owns the read-write connection for one database file and the thread that
+    drains its write queue.
+
+    Queue items are either `(sql, params)` tuples, executed and committed in
+    batches, or `(fn, future)` pairs, run after the pending batch is committed
+    with the result (or exception) delivered through the future. A `None` item
+    stops the thread once everything queued before it has been committed.
+    """
+    def __init__(self, db_abs_path: str):
+        self.conn = sqlite3.connect(db_abs_path, check_same_thread=False)
+        # WAL turns each commit into a single append and lets readers run alongside the writer
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
+        self.conn.execute("PRAGMA temp_store = MEMORY")
+        self.conn.execute("PRAGMA cache_size = -64000") # ~64 MB page cache
+        self.conn.execute("PRAGMA busy_timeout = 5000")
+        self.conn.execute("PRAGMA mmap_size = 268435456") # 256 MB
+        self.conn.execute("PRAGMA foreign_keys = ON") # Ensure foreign key constraints are enforced
+        self.conn.row_factory = sqlite3.Row # Access columns by name
+        self.queue = queue.Queue()
+        self.refs = 0 # Number of DBManager instances using this writer
+        self.thread = threading.Thread(target=self._loop, name="DBWriter", daemon=True)
+
+    def _loop(self):
+        """Drains the write queue until the stop sentinel arrives."""
+        stopping = False
+        while not stopping:
+            batch = [self.queue.get()]
+            deadline = time.monotonic() + _WRITE_BATCH_WINDOW
+            while len(batch) < _WRITE_BATCH_SIZE:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(self.queue.get(timeout=timeout))
+                except queue.Empty:
+                    break
+
+            try:
+                for item in batch:
+                    if item is None:
+                        stopping = True
+                        continue
+                    first, second = item
+                    if callable(first):
+                        try:
+                            self.conn.commit() # Callables manage their own transaction
+                            second.set_result(first())
+                        except BaseException as e:
+                            second.set_exception(e)
+                        continue
+                    try:
+                        self.conn.execute(first, second)
+                    except Exception as e:
+                        # A failed statement is rolled back on its own; keep the rest of the batch
+                        print(f"Warning: Failed to write to model registry: {e}")
+                try:
+                    self.conn.commit()
+                except sqlite3.Error as e:
+                    print(f"Warning: Failed to commit model registry writes: {e}")
+                    self.conn.rollback()
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+        self.conn.close()
+
+    def check(self):
+        """Raises if the writer thread has stopped, instead of letting callers wait forever."""
+        if not self.thread.is_alive():
+            raise RuntimeError("Model registry writer thread is not running.")
+
+    def put(self, item):
+        """Queues a `(sql, params)` write."""
+        self.check()
+        self.queue.put(item)
+
+    def call(self, fn):
+        """Runs `fn` on the writer thread and returns its result once committed."""
+        future = Future()
+        self.put((fn, future))
+        while True:
+            try:
+                return future.result(timeout=0.1)
+            except FutureTimeoutError:
+                self.check()
+
+    def flush(self):
+        """Blocks until every queued write has been committed; raises if the writer has stopped."""
+        with self.queue.all_tasks_done:
+            while self.queue.unfinished_tasks:
+                self.check()
+                self.queue.all_tasks_done.wait(0.1)
+
+    def stop(self):
+        """Commits pending writes, then stops the thread and closes the connection."""
+        if not self.thread.is_alive():
+            return
+        self.queue.put(None)
+        if threading.current_thread() is not self.thread:
+            self.thread.join()
+
 class DBManager:
     """
     Manages SQLite database for models.
 
     Key features:
-      - Registers models, optionally creating a directory (./out/{name}_{id}/) if not specified.
+      - Registers models, assigning a directory (./out/{name}_{id}/) if not specified.
       - Renames model-related directories (./data and ./out) synchronously with database updates.
-      - Deletes model-related directories synchronously with database updates.
+      - Deletes model-related directories along with their database records: each directory is
+        renamed to a `.trash-<ts>` sibling and removed in the background. If the process is
+        killed before removal finishes, those `.trash-<ts>` folders can remain in ./out and ./data.
       - Retrieves basic model information like name and directory path.
       - Uses relative paths for better project portability.
+      - Serializes all writes through one writer thread per database file, shared by every
+        instance in the process. Config/log/history saves are queued and committed in
+        batches; getters flush the shared queue first, so they see writes from any instance.
+        Queued saves return immediately, so database errors (e.g., an unknown model_id)
+        are printed as warnings instead of being raised to the caller.
     """
     # Initialization and table creation
     def __init__(self, db_path: str = "assets/model_registry.db"):
@@ -33,71 +229,169 @@ class DBManager:
         if not os.path.exists(db_dir):
             os.makedirs(db_dir, exist_ok=True)
         
-        self.conn = sqlite3.connect(db_abs_path, check_same_thread=False)
-        self.conn.execute("PRAGMA foreign_keys = ON") # Ensure foreign key constraints are enforced
-        self.conn.row_factory = sqlite3.Row # Access columns by name
-        self._create_tables()
+        self._cwd = PROJECT_ROOT # Cached once so path helpers avoid a getcwd() syscall per call
+        db_key = os.path.normpath(db_abs_path)
+        with _info_cache_lock:
+            self._info_cache = _info_caches.setdefault(db_key, OrderedDict())
+            self._missing = _missing_caches.setdefault(db_key, {})
+            _info_generations.setdefault(db_key, 0)
+        self._cache_key = db_key
+
+        # All writes go through the writer shared by every instance on this database file;
+        # self.conn is its read-write connection, used only on the writer thread
+        with _writers_lock:
+            writer = _writers.get(db_key)
+            if writer is None:
+                writer = _RegistryWriter(db_abs_path)
+                self.conn = writer.conn
+                try:
+                    self._create_tables()
+                except sqlite3.Error:
+                    writer.conn.close()
+                    raise
+                writer.thread.start()
+                _writers[db_key] = writer
+            writer.refs += 1
+        self._writer = writer
+        self.conn = writer.conn
+
+        # Read-only connections for getters; under WAL they read alongside the writer.
+        # ro_conn returns sqlite3.Row for multi-column lookups, while fast_ro keeps the
+        # default tuple rows for single-column getters (no per-row name mapping).
+        self.ro_conn = self._connect_ro(db_abs_path)
+        self.ro_conn.row_factory = sqlite3.Row
+        self.fast_ro = self._connect_ro(db_abs_path)
+
+        # Background workers that remove deleted model directories from disk
+        self._rm_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ModelDelete")
+
+        # Released on close(), garbage collection, or interpreter exit (queued writes are committed)
+        self._finalizer = weakref.finalize(
+            self, DBManager._release, db_key, writer, (self.ro_conn, self.fast_ro), self._rm_pool
+        )
 
     def _create_tables(self):
         """
         Creates database tables if they don't already exist.
 
         Tables include: models, training_configs, training_logs,
-        inference_configs, and inference_history.
+        inference_configs, and inference_history. An index on
+        models.created_at lets get_all_models stream rows without a sort.
+        Small one-row-per-model tables are stored WITHOUT ROWID; databases from
+        older schema versions have those tables rebuilt in the same transaction
+        (columns are copied positionally, so existing JSON config rows carry over).
         """
         cur = self.conn.cursor()
-        cur.executescript(
-            """
-            CREATE TABLE IF NOT EXISTS models(
-                id INTEGER PRIMARY KEY,
-                name TEXT NOT NULL,
-                dir_path TEXT NOT NULL UNIQUE,
-                created_at TEXT NOT NULL
-            );
-            CREATE TABLE IF NOT EXISTS training_configs(
-                model_id INTEGER PRIMARY KEY,
-                config_json TEXT NOT NULL,
-                FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
-            );
-            CREATE TABLE IF NOT EXISTS training_logs(
-                model_id INTEGER PRIMARY KEY,
-                log_path TEXT NOT NULL,
-                FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
-            );
-            CREATE TABLE IF NOT EXISTS inference_configs(
-                model_id INTEGER PRIMARY KEY,
-                config_json TEXT NOT NULL,
-                FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
-            );
-            CREATE TABLE IF NOT EXISTS inference_history(
-                model_id INTEGER PRIMARY KEY,
-                content TEXT,
-                FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
-            );
-            """
+        legacy_tables = []
+        if cur.execute("PRAGMA user_version").fetchone()[0] < _SCHEMA_VERSION:
+            # Move old rowid tables aside so the CREATE statements below rebuild them
+            legacy_tables = [
+                row[0] for row in cur.execute(
+                    "SELECT name FROM sqlite_master WHERE type = 'table' AND name IN (?,?,?)",
+                    _WITHOUT_ROWID_TABLES
+                )
+            ]
+        try:
+            cur.executescript(
+                "BEGIN;"
+                + "".join(f"ALTER TABLE {t} RENAME TO {t}_v0;" for t in legacy_tables)
+                + """
+                CREATE TABLE IF NOT EXISTS models(
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    dir_path TEXT NOT NULL UNIQUE,
+                    created_at TEXT NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS idx_models_created_at ON models(created_at DESC);
+                CREATE TABLE IF NOT EXISTS training_configs(
+                    model_id INTEGER PRIMARY KEY,
+                    config_blob BLOB NOT NULL,
+                    FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS training_logs(
+                    model_id INTEGER PRIMARY KEY,
+                    log_path TEXT NOT NULL,
+                    FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS inference_configs(
+                    model_id INTEGER PRIMARY KEY,
+                    config_blob BLOB NOT NULL,
+                    FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
+                ) WITHOUT ROWID;
+                CREATE TABLE IF NOT EXISTS inference_history(
+                    model_id INTEGER PRIMARY KEY,
+                    content TEXT,
+                    FOREIGN KEY(model_id) REFERENCES models(id) ON DELETE CASCADE
+                );
+                """
+                + "".join(
+                    f"INSERT INTO {t} SELECT * FROM {t}_v0 WHERE model_id IN (SELECT id FROM models);"
+                    f"DROP TABLE {t}_v0;"
+                    for t in legacy_tables
+                )
+                + f"PRAGMA user_version = {_SCHEMA_VERSION};"
+                + "COMMIT;"
+            )
+        except sqlite3.Error:
+            self.conn.rollback() # Leave a legacy database untouched if the rebuild fails
+            raise
+
+    @staticmethod
+    def _connect_ro(db_abs_path: str) -> sqlite3.Connection:
+        """Opens a read-only connection to the database with the read-side pragmas applied."""
+        conn = sqlite3.connect(
+            f"file:{pathname2url(db_abs_path)}?mode=ro", uri=True, check_same_thread=False
         )
-        self.conn.commit()
+        conn.execute("PRAGMA query_only = ON")
+        conn.execute("PRAGMA temp_store = MEMORY")
+        conn.execute("PRAGMA cache_size = -64000")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        conn.execute("PRAGMA mmap_size = 268435456")
+        return conn
+
+    @staticmethod
+    def _release(db_key: str, writer: "_RegistryWriter", ro_conns: tuple, rm_pool: ThreadPoolExecutor):
+        """
+        Frees an instance's resources. Runs through `weakref.finalize`, so it is
+        triggered by close(), by garbage collection, or at interpreter exit.
+        """
+        for conn in ro_conns:
+            conn.close()
+        rm_pool.shutdown(wait=False) # Directory removals already submitted still run
+        with _writers_lock:
+            writer.refs -= 1
+            last_ref = writer.refs == 0
+            if last_ref:
+                _writers.pop(db_key, None)
+        if last_ref:
+            writer.stop() # Commits anything still queued before closing the connection
+
+    def close(self):
+        """Releases this instance's connections and threads. Safe to call more than once."""
+        self._finalizer()
+
+    def flush(self):
+        """
+        Blocks until every write queued for this database file has been committed,
+        including writes queued by other DBManager instances in the process.
+        """
+        self._writer.flush()
 
     # Internal path utilities
     def _rel(self, path: str) -> str:
         """
-        Converts an absolute path to a path relative to the current working directory.
+        Converts an absolute path to a path relative to the project root.
         Enhanced for better portability.
         """
         if os.path.isabs(path):
-            # Try to get a relative path from the current working directory
-            try:
-                return os.path.relpath(path, os.getcwd())
-            except ValueError:
-                # If on different drives (Windows), return the original path
-                return path
+            return _rel_cached(path, self._cwd)
         else:
             # Already a relative path, return directly
             return path
 
     def _abs(self, rel_path: str) -> str:
         """
-        Converts a path relative to the current working directory to an absolute path.
+        Converts a path relative to the project root to an absolute path.
         Enhanced for better portability.
         """
         if not rel_path:
@@ -107,8 +401,47 @@ class DBManager:
             # Already an absolute path, return directly
             return rel_path
         else:
-            # Relative path, convert to absolute
-            return os.path.abspath(os.path.join(os.getcwd(), rel_path))
+            # Relative path, join onto the cached project root
+            return _abs_cached(rel_path, self._cwd)
+
+    def _remove_dir_async(self, path: str):
+        """
+        Moves a directory to a `.trash-<ts>` sibling, then removes it on a worker thread.
+
+        The rename is atomic, so the original path is free for reuse immediately.
+        """
+        trash_path = f"{path}.trash-{time.time_ns()}"
+        try:
+            os.rename(path, trash_path)
+        except FileNotFoundError:
+            return
+        except OSError:
+            # Rename can fail (e.g., locked files on Windows); remove in place instead
+            trash_path = path
+        self._rm_pool.submit(shutil.rmtree, trash_path, ignore_errors=True)
+
+    # Config serialization
+    @staticmethod
+    def _dump_cfg(cfg: dict):
+        """Encodes a config as msgpack bytes, or compact JSON text if msgpack is unavailable."""
+        if msgpack is not None:
+            return msgpack.packb(cfg, use_bin_type=True)
+        return json.dumps(cfg, ensure_ascii=False, separators=(',', ':'))
+
+    @staticmethod
+    def _load_cfg(value) -> dict:
+        """
+        Decodes a stored config. Text values are JSON (rows written before the
+        switch to msgpack, or without msgpack installed); they are re-encoded on the next save.
+        """
+        if isinstance(value, str):
+            return json.loads(value)
+        if msgpack is None:
+            raise ImportError(
+                "This config was stored with msgpack, but the `msgpack` library is not installed. "
+                "Please install it by running: pip install msgpack"
+            )
+        return msgpack.unpackb(value, raw=False)
 
     # Model registration and basic info
     def register_model(self, name: str, dir_path: Optional[str] = None) -> int:
@@ -126,71 +459,117 @@ class DBManager:
         Parameters:
         name: The display name for the model.
         dir_path: Optional. The directory path for the model. If not provided,
-                  a new directory ./out/{name}_{timestamp_id}/ will be automatically
-                  created and registered.
+                  ./out/{name}_{timestamp_id}/ is registered; the directory itself is
+                  created lazily by `ensure_model_dir` before the first write.
 
         Returns:
         int: The unique model ID, which is also the timestamp used in auto-generated directory names.
         """
-        cur = self.conn.cursor()
-
-        # If a directory path is provided, check if it's already registered.
+        # If a directory path is provided, insert it unless it's already registered.
         if dir_path:
             rel_path = self._rel(dir_path)
-            cur.execute("SELECT id FROM models WHERE dir_path = ?", (rel_path,))
-            row = cur.fetchone()
-            if row:
-                # If registered, return its ID.
-                return row["id"]
-
-            # If not registered, ensure the directory exists, then proceed with registration.
-            abs_path = self._abs(rel_path)
-            if not os.path.exists(abs_path):
-                os.makedirs(abs_path, exist_ok=True)
-
             # Use a unified timestamp for the directory suffix and as the model ID.
             ts_ms = int(time.time() * 1000)
-            cur.execute(
-                "INSERT INTO models(id, name, dir_path, created_at) "
-                "VALUES(?,?,?,datetime('now'))",
-                (ts_ms, name, rel_path)
-            )
-            self.conn.commit()
-            return ts_ms
+            # Format created_at from the same timestamp (UTC, like datetime('now')).
+            created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts_ms / 1000))
+
+            def insert():
+                with self.conn:
+                    row = self.conn.execute(
+                        "INSERT INTO models(id, name, dir_path, created_at) "
+                        "VALUES(?,?,?,?) "
+                        "ON CONFLICT(dir_path) DO NOTHING RETURNING id",
+                        (ts_ms, name, rel_path, created_at)
+                    ).fetchone()
+                    if row is None:
+                        # Already registered, return the existing ID.
+                        row = self.conn.execute(_SQL_GET_ID_BY_DIR, (rel_path,)).fetchone()
+                        return row["id"]
+
+                    # Newly registered, ensure the directory exists before committing.
+                    os.makedirs(self._abs(rel_path), exist_ok=True)
+                return ts_ms
+
+            model_id = self._writer.call(insert)
+            self._invalidate_info(model_id)
+            return model_id
 
         # If no directory path is provided, auto-generate one.
         ts_ms = int(time.time() * 1000)
+        created_at = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(ts_ms / 1000))
         auto_folder_name = f"{name}_{ts_ms}"
         # Default output directory is ./out/
         dir_path_rel = self._rel(os.path.join("out", auto_folder_name))
-        os.makedirs(self._abs(dir_path_rel), exist_ok=True)
 
-        cur.execute(
-            "INSERT INTO models(id, name, dir_path, created_at) "
-            "VALUES(?,?,?,datetime('now'))",
-            (ts_ms, name, dir_path_rel)
-        )
-        self.conn.commit()
+        def insert():
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO models(id, name, dir_path, created_at) "
+                    "VALUES(?,?,?,?)",
+                    (ts_ms, name, dir_path_rel, created_at)
+                )
+
+        self._writer.call(insert)
+        self._invalidate_info(ts_ms)
         return ts_ms
     
+    def ensure_model_dir(self, model_id: int) -> str:
+        """
+        Creates the model's registered directory if needed and returns its absolute path.
+        Call this right before writing into the directory.
+        """
+        info = self.get_model_basic_info(model_id)
+        if not info:
+            raise ValueError(f"Model {model_id} does not exist.")
+        dir_abs = self._abs(info["dir_path"])
+        os.makedirs(dir_abs, exist_ok=True)
+        return dir_abs
+
     def get_model_id_by_dir(self, dir_path: str) -> Optional[int]:
         """
         Retrieves the model ID associated with the given directory path.
         """
         dir_path_rel = self._rel(dir_path)
-        cur = self.conn.cursor()
-        cur.execute("SELECT id FROM models WHERE dir_path = ?", (dir_path_rel,))
-        row = cur.fetchone()
-        return row["id"] if row else None
+        row = self.fast_ro.execute(_SQL_GET_ID_BY_DIR, (dir_path_rel,)).fetchone()
+        return row[0] if row else None
     
     def get_model_basic_info(self, model_id: int) -> Optional[dict]:
         """
         Returns basic information for a model (name and directory path).
+        Results are served from an in-process LRU, invalidated on rename and delete;
+        IDs already found missing return None without querying.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT name, dir_path FROM models WHERE id = ?", (model_id,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        with _info_cache_lock:
+            if model_id in self._missing:
+                return None
+            info = self._info_cache.get(model_id)
+            if info is not None:
+                self._info_cache.move_to_end(model_id)
+                return dict(info)
+            generation = _info_generations[self._cache_key]
+
+        row = self.ro_conn.execute(_SQL_GET_BASIC, (model_id,)).fetchone()
+        if not row:
+            with _info_cache_lock:
+                if _info_generations[self._cache_key] == generation:
+                    self._missing[model_id] = None
+                    if len(self._missing) > _MISSING_CACHE_SIZE:
+                        del self._missing[next(iter(self._missing))]
+            return None
+        info = dict(row)
+        with _info_cache_lock:
+            if _info_generations[self._cache_key] == generation:
+                self._info_cache[model_id] = info
+                if len(self._info_cache) > _INFO_CACHE_SIZE:
+                    self._info_cache.popitem(last=False)
+        return dict(info)
+
+    def _invalidate_info(self, model_id: int):
+        """Drops a model's cached basic info after it has been modified."""
+        with _info_cache_lock:
+            _info_generations[self._cache_key] += 1
+            self._info_cache.pop(model_id, None)
+            self._missing.pop(model_id, None)
 
     def rename_model(self, model_id: int, new_name: str):
         """
@@ -216,130 +595,115 @@ class DBManager:
         # Construct new path by joining the original parent with the new folder name
         new_out_abs = self._abs(os.path.join(old_dir_path_parent, new_folder_name))
 
-        if os.path.exists(old_out_abs):
+        # The new path shares the old parent, so a missing source is the only expected failure
+        try:
             os.rename(old_out_abs, new_out_abs)
+        except FileNotFoundError:
+            pass
         
         # Also rename corresponding directory in ./data/ if it exists
         # Assumes ./data/{folder_name} structure
         old_data_abs = self._abs(os.path.join("data", old_folder_name))
         new_data_abs = self._abs(os.path.join("data", new_folder_name))
-        if os.path.exists(old_data_abs):
-            # Ensure parent of new_data_abs exists (it should be 'data')
-            os.makedirs(os.path.dirname(new_data_abs), exist_ok=True)
+        try:
             os.rename(old_data_abs, new_data_abs)
+        except FileNotFoundError:
+            pass
 
-        # Update model record with new name and directory path.
-        cur = self.conn.cursor()
-        cur.execute(
-            "UPDATE models SET name = ?, dir_path = ? WHERE id = ?",
-            (new_name, self._rel(new_out_abs), model_id)
-        )
-        
-        # Update training log path if applicable.
-        cur.execute("SELECT log_path FROM training_logs WHERE model_id = ?", (model_id,))
-        log_row = cur.fetchone()
-        if log_row:
-            old_log_path_rel = log_row["log_path"]
-            # Update log path to reflect new folder name.
-            if old_folder_name in old_log_path_rel:
-                # Replace only the folder name part of the path
-                new_log_path_rel = old_log_path_rel.replace(old_folder_name, new_folder_name)
+        # Update model record and training log path in a single transaction.
+        def update():
+            with self.conn:
+                cur = self.conn.cursor()
                 cur.execute(
-                    "UPDATE training_logs SET log_path = ? WHERE model_id = ?",
-                    (new_log_path_rel, model_id)
+                    "UPDATE models SET name = ?, dir_path = ? WHERE id = ?",
+                    (new_name, self._rel(new_out_abs), model_id)
                 )
-        
-        self.conn.commit()
+                # Update training log path if applicable.
+                log_row = cur.execute(_SQL_GET_TRAIN_LOG, (model_id,)).fetchone()
+                if log_row:
+                    old_log_path_rel = log_row["log_path"]
+                    # Replace only whole path components matching the old folder name
+                    new_log_path_rel = os.sep.join(
+                        new_folder_name if part == old_folder_name else part
+                        for part in old_log_path_rel.split(os.sep)
+                    )
+                    if new_log_path_rel != old_log_path_rel:
+                        cur.execute(
+                            "UPDATE training_logs SET log_path = ? WHERE model_id = ?",
+                            (new_log_path_rel, model_id)
+                        )
+
+        self._writer.call(update)
+        self._invalidate_info(model_id)
 
     # Training and inference: configs, logs, and history
     def save_training_config(self, model_id: int, cfg: dict):
         """Saves or updates the training configuration for a model."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO training_configs(model_id, config_json) "
-            "VALUES(?,?) "
-            "ON CONFLICT(model_id) DO UPDATE SET config_json=excluded.config_json",
-            (model_id, json.dumps(cfg, ensure_ascii=False, indent=2))
-        )
-        self.conn.commit()
+        self._writer.put((
+            _SQL_SAVE_TRAIN_CFG,
+            (model_id, self._dump_cfg(cfg))
+        ))
 
     def save_training_log(self, model_id: int, log_path: str):
         """Saves or updates the training log path for a model (stored relative to project root)."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO training_logs(model_id, log_path) "
-            "VALUES(?,?) "
-            "ON CONFLICT(model_id) DO UPDATE SET log_path=excluded.log_path",
+        self._writer.put((
+            _SQL_SAVE_TRAIN_LOG,
             (model_id, self._rel(log_path)) # Store relative path
-        )
-        self.conn.commit()
+        ))
 
     def save_inference_config(self, model_id: int, cfg: dict):
         """Saves or updates the inference configuration for a model."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO inference_configs(model_id, config_json) "
-            "VALUES(?,?) "
-            "ON CONFLICT(model_id) DO UPDATE SET config_json=excluded.config_json",
-            (model_id, json.dumps(cfg, ensure_ascii=False, indent=2))
-        )
-        self.conn.commit()
+        self._writer.put((
+            _SQL_SAVE_INFER_CFG,
+            (model_id, self._dump_cfg(cfg))
+        ))
 
     def save_inference_history(self, model_id: int, content: str):
         """Saves or updates the inference history for a model."""
-        cur = self.conn.cursor()
-        cur.execute(
-            "INSERT INTO inference_history(model_id, content) "
-            "VALUES(?,?) "
-            "ON CONFLICT(model_id) DO UPDATE SET content=excluded.content",
+        self._writer.put((
+            _SQL_SAVE_INFER_HIST,
             (model_id, content)
-        )
-        self.conn.commit()
+        ))
 
     def clear_inference_history(self, model_id: int):
         """
         Deletes all inference history entries for the specified model.
         """
-        self.conn.execute("DELETE FROM inference_history WHERE model_id = ?", (model_id,))
-        self.conn.commit()
+        self._writer.put((_SQL_CLEAR_INFER_HIST, (model_id,)))
 
     def get_training_config(self, model_id: int) -> Optional[dict]:
         """
         Retrieves the training configuration (as a dictionary) for the specified model.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT config_json FROM training_configs WHERE model_id = ?", (model_id,))
-        row = cur.fetchone()
-        return json.loads(row["config_json"]) if row else None
+        self.flush()
+        row = self.fast_ro.execute(_SQL_GET_TRAIN_CFG, (model_id,)).fetchone()
+        return self._load_cfg(row[0]) if row else None
 
     def get_training_log_path(self, model_id: int) -> str:
         """
         Retrieves the absolute path to the training log file for the specified model.
         Returns an empty string if not found.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT log_path FROM training_logs WHERE model_id = ?", (model_id,))
-        row = cur.fetchone()
-        return self._abs(row["log_path"]) if row and row["log_path"] else ""
+        self.flush()
+        row = self.fast_ro.execute(_SQL_GET_TRAIN_LOG, (model_id,)).fetchone()
+        return self._abs(row[0]) if row and row[0] else ""
 
     def get_inference_config(self, model_id: int) -> Optional[dict]:
         """
         Retrieves the inference configuration (as a dictionary) for the specified model.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT config_json FROM inference_configs WHERE model_id = ?", (model_id,))
-        row = cur.fetchone()
-        return json.loads(row["config_json"]) if row else None
+        self.flush()
+        row = self.fast_ro.execute(_SQL_GET_INFER_CFG, (model_id,)).fetchone()
+        return self._load_cfg(row[0]) if row else None
 
     def get_inference_history(self, model_id: int) -> str:
         """
         Retrieves the last inference history content for the specified model.
         Returns an empty string if not found.
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT content FROM inference_history WHERE model_id = ?", (model_id,))
-        row = cur.fetchone()
-        return row["content"] if row else ""
+        self.flush()
+        row = self.fast_ro.execute(_SQL_GET_INFER_HIST, (model_id,)).fetchone()
+        return row[0] if row else ""
 
     # Delete model (cascades to files and database entries)
     def delete_model(self, model_id: int):
@@ -349,29 +713,34 @@ class DBManager:
         Associated directories typically include the main model directory (often in './out/')
         and a corresponding data directory (often in './data/').
         Foreign key constraints with ON DELETE CASCADE handle related table entries.
+        The database row is removed first; directories are moved aside and deleted
+        in the background so the call returns without waiting on the filesystem.
         """
-        info = self.get_model_basic_info(model_id)
-        if info and info["dir_path"]:
+        # Deleting from 'models' table will cascade to related tables due to FOREIGN KEY ... ON DELETE CASCADE
+        # RETURNING hands back the directory in the same statement, with no separate lookup
+        def delete():
+            with self.conn:
+                return self.conn.execute(
+                    "DELETE FROM models WHERE id = ? RETURNING dir_path", (model_id,)
+                ).fetchone()
+
+        row = self._writer.call(delete)
+        self._invalidate_info(model_id)
+
+        if row and row["dir_path"]:
             # The main registered directory (e.g., in ./out/ or custom path)
-            registered_model_dir_abs = self._abs(info["dir_path"])
-            if os.path.exists(registered_model_dir_abs):
-                shutil.rmtree(registered_model_dir_abs, ignore_errors=True)
+            registered_model_dir_abs = self._abs(row["dir_path"])
+            self._remove_dir_async(registered_model_dir_abs)
 
             # Conventionally, a corresponding folder might exist in ./data/
-            folder_name = os.path.basename(info["dir_path"]) # Get "name_id" part
+            folder_name = os.path.basename(row["dir_path"]) # Get "name_id" part
             data_dir_abs = self._abs(os.path.join("data", folder_name))
-            if os.path.exists(data_dir_abs) and data_dir_abs != registered_model_dir_abs: # Avoid double delete if dir_path was in data
-                shutil.rmtree(data_dir_abs, ignore_errors=True)
-        
-        # Deleting from 'models' table will cascade to related tables due to FOREIGN KEY ... ON DELETE CASCADE
-        self.conn.execute("DELETE FROM models WHERE id = ?", (model_id,))
-        self.conn.commit()
+            if data_dir_abs != registered_model_dir_abs: # Avoid double delete if dir_path was in data
+                self._remove_dir_async(data_dir_abs)
 
     # List all models
     def get_all_models(self) -> list[dict]:
         """
         Returns a list of all models (ID and name), ordered by creation time (most recent first).
         """
-        cur = self.conn.cursor()
-        cur.execute("SELECT id, name FROM models ORDER BY created_at DESC")
-        return [dict(row) for row in cur.fetchall()]
\ No newline at end of file
+        return [dict(row) for row in self.ro_conn.execute(_SQL_GET_ALL).fetchall()]
@@ -15,6 +15,8 @@ from src.gpt_self_attn import GPTSelfAttnConfig, GPTSelfAttn
 from src.device_manager import device_manager
 from src.db_manager import DBManager
 
+dbm = DBManager()
+
 
 class ModelCache:
     """
@@ -449,7 +451,6 @@ def cached_generate_text(
     cache = None
     try:
         # Database integration - get model_id for saving inference history
-        dbm = DBManager()
         ckpt_dir = out_dir if out_dir.endswith('.pt') else os.path.join(out_dir, 'ckpt.pt')
         model_dir_for_db = os.path.dirname(ckpt_dir)
         model_name_for_db = os.path.basename(model_dir_for_db) or "new_model"
@@ -188,7 +188,7 @@ def train_model_generator(
 
 
     if master_process:
-        os.makedirs(out_dir, exist_ok=True)
+        dbm.ensure_model_dir(model_id)
         if num_eval_seeds == 0:
             print(f"Training starts, seed={current_seed_val} ...")
         else: